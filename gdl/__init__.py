@@ -18,14 +18,33 @@ __author__ = "mfaeezshabbir"
 __email__ = "mfaeezshabbir@gmail.com"
 __license__ = "MIT"
 
-from .downloader import gdlcli, URLError, DownloadError
-from .utils import download
-
 # Make the main classes and functions available at package level
 __all__ = [
     "gdlcli",
-    "download", 
+    "download",
+    "download_many",
     "URLError",
     "DownloadError",
     "__version__"
 ]
+
+# Lazy re-exports (PEP 562) - importing the package stays near-instant
+# because requests/tqdm are only pulled in when a download actually runs
+_LAZY_IMPORTS = {
+    "gdlcli": ".downloader",
+    "URLError": ".downloader",
+    "DownloadError": ".downloader",
+    "download": ".utils",
+    "download_many": ".utils",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # cache so subsequent lookups skip __getattr__
+    return value
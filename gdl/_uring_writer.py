@@ -0,0 +1,111 @@
+"""
+io_uring-backed file writer for gdlcli package.
+Batches chunk writes into ring submissions so the kernel reaps many writes
+per io_uring_enter instead of one write(2) syscall per chunk.
+"""
+
+import os
+import sys
+
+# Optional dependency - plain f.write remains the default path
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# Submission-queue depth; writes are flushed whenever the queue fills
+SQ_DEPTH = 128
+
+
+def _kernel_supports_uring() -> bool:
+    """io_uring needs Linux >= 5.6 for IORING_OP_WRITE."""
+    if not sys.platform.startswith('linux'):
+        return False
+    try:
+        major, minor = os.uname().release.split('.')[:2]
+        return (int(major), int(minor)) >= (5, 6)
+    except (ValueError, AttributeError):
+        return False
+
+
+def available() -> bool:
+    """Whether the io_uring write path can be used on this system."""
+    return liburing is not None and _kernel_supports_uring()
+
+
+class UringWriter:
+    """
+    Sequential file writer that queues writes on an io_uring.
+
+    Submissions are batched until the queue fills (or close() is called),
+    then submitted and reaped together. Each SQE is tagged with user_data
+    so its completion can be matched back to the queued buffer; buffers
+    are kept referenced until their completions are consumed.
+    """
+
+    def __init__(self, fd: int, offset: int = 0, sq_depth: int = SQ_DEPTH):
+        self.fd = fd
+        self.offset = offset
+        self.sq_depth = sq_depth
+        self.ring = liburing.Ring()
+        liburing.io_uring_queue_init(sq_depth, self.ring)
+        self._cqe = liburing.Cqe()
+        # tag -> (buffer, file offset) for writes awaiting completion
+        self._inflight = {}
+        self._next_tag = 0
+
+    def write(self, chunk):
+        """Queue one chunk; submits automatically when the queue is full."""
+        sqe = liburing.io_uring_get_sqe(self.ring)
+        if not sqe:
+            self.flush()
+            sqe = liburing.io_uring_get_sqe(self.ring)
+
+        # Own the buffer until its completion is reaped
+        buf = bytes(chunk)
+        tag = self._next_tag
+        self._next_tag += 1
+        liburing.io_uring_prep_write(sqe, self.fd, buf, self.offset)
+        liburing.io_uring_sqe_set_data64(sqe, tag)
+        self._inflight[tag] = (buf, self.offset)
+        self.offset += len(buf)
+
+        if len(self._inflight) >= self.sq_depth:
+            self.flush()
+
+    def flush(self):
+        """Submit queued writes and wait for all their completions.
+
+        Completions are matched to their buffers via user_data; a short
+        write (positive result smaller than the buffer, e.g. near
+        ENOSPC) is finished synchronously instead of silently dropping
+        the tail.
+        """
+        if not self._inflight:
+            return
+
+        liburing.io_uring_submit(self.ring)
+        while self._inflight:
+            liburing.io_uring_wait_cqe(self.ring, self._cqe)
+            entry = self._cqe[0]
+            res = entry.res
+            tag = entry.user_data
+            liburing.io_uring_cqe_seen(self.ring, entry)
+
+            if res < 0:
+                raise IOError(f"io_uring write failed: errno {-res}")
+
+            buf, offset = self._inflight.pop(tag)
+            while res < len(buf):
+                written = os.pwrite(self.fd, memoryview(buf)[res:], offset + res)
+                if written <= 0:
+                    raise IOError(
+                        f"short io_uring write at offset {offset + res}")
+                res += written
+
+    def close(self):
+        """Flush outstanding writes and tear down the ring."""
+        try:
+            self.flush()
+        finally:
+            liburing.io_uring_queue_exit(self.ring)
@@ -8,7 +8,8 @@ import sys
 import os
 from typing import Optional
 
-from .downloader import gdlcli, URLError, DownloadError
+# .downloader (and with it requests/tqdm) is imported inside the handlers
+# so `gdlcli --version` / `--help` don't pay the heavy-import cost
 from .utils import validate_url
 from . import __version__
 
@@ -120,6 +121,8 @@ def validate_args(args: argparse.Namespace) -> bool:
 
 def handle_single_download(args: argparse.Namespace) -> bool:
     """Handle single file download."""
+    from .downloader import gdlcli, URLError, DownloadError
+
     try:
         # Create downloader instance
         config_options = {}
@@ -191,6 +194,8 @@ def handle_single_download(args: argparse.Namespace) -> bool:
 
 def handle_batch_download(args: argparse.Namespace) -> bool:
     """Handle batch file download."""
+    from .downloader import gdlcli, URLError, DownloadError
+
     try:
         # Create downloader instance
         config_options = {}
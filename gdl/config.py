@@ -15,11 +15,16 @@ class Config:
     # Default configuration values
     DEFAULT_CONFIG = {
         "output_dir": "./downloads",
-        "chunk_size": 8192,
+        "chunk_size": 1 << 20,  # 1 MiB - large chunks keep Python out of the hot loop
+        "max_workers": 8,
+        "parallel_segments": 1,
         "max_retries": 3,
         "retry_delay": 1.0,
         "timeout": 30,
         "verify_ssl": True,
+        "use_async": False,
+        "use_http2": False,
+        "group_by_host": False,
         "auto_create_dirs": True,
         "log_level": "INFO"
     }
@@ -78,7 +83,7 @@ class Config:
             
             if env_value is not None:
                 # Convert string values to appropriate types
-                if key in ["chunk_size", "max_retries", "timeout"]:
+                if key in ["chunk_size", "max_workers", "parallel_segments", "max_retries", "timeout"]:
                     try:
                         self.config[key] = int(env_value)
                     except ValueError:
@@ -88,7 +93,7 @@ class Config:
                         self.config[key] = float(env_value)
                     except ValueError:
                         print(f"Warning: Invalid float value for {env_key}: {env_value}")
-                elif key in ["verify_ssl", "auto_create_dirs"]:
+                elif key in ["verify_ssl", "use_async", "use_http2", "group_by_host", "auto_create_dirs"]:
                     self.config[key] = env_value.lower() in ('true', '1', 'yes', 'on')
                 else:
                     self.config[key] = env_value
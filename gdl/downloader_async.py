@@ -0,0 +1,154 @@
+"""
+Async download path for gdlcli package.
+Streams batches of files through one shared aiohttp session so hundreds of
+in-flight downloads share a few keep-alive sockets.
+"""
+
+import asyncio
+import os
+import re
+from typing import List, Optional
+
+import aiohttp
+
+# Non-blocking file writes keep disk I/O off the event loop when available
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+from .downloader import _EXPORT_EXTENSIONS
+from .utils import (
+    setup_logging, extract_file_id, build_download_url,
+    get_confirmation_url
+)
+
+# Mirror the browser headers used by the sync session
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Bounded confirmation scan and token patterns, mirroring the sync
+# downloader's handling of the large-file interstitial page
+_CONFIRM_SCAN_BYTES = 64 * 1024
+_CONFIRM_TOKEN_PATTERN = re.compile(r'confirm=([^&]+)')
+_CONFIRM_FORM_PATTERN = re.compile(r'name="confirm" value="([^"]+)"')
+
+
+async def download_file_async(url: str, output_path: str,
+                              format: Optional[str] = None,
+                              session: Optional[aiohttp.ClientSession] = None,
+                              chunk_size: int = 1 << 20,
+                              timeout: int = 30) -> bool:
+    """
+    Download a single file from Google Drive asynchronously.
+
+    Args:
+        url: Google Drive URL
+        output_path: Output file path
+        format: Export format for Google Docs/Sheets/Slides
+        session: Shared aiohttp session (one is created if omitted)
+        chunk_size: Read chunk size in bytes
+        timeout: Socket read timeout in seconds
+
+    Returns:
+        True if download successful, False otherwise
+    """
+    if session is None:
+        async with aiohttp.ClientSession(headers=DEFAULT_HEADERS) as own_session:
+            return await download_file_async(
+                url, output_path, format, own_session, chunk_size, timeout)
+
+    file_id = extract_file_id(url)
+    if not file_id:
+        return False
+
+    request_url = build_download_url(file_id, format)
+    client_timeout = aiohttp.ClientTimeout(total=None, sock_read=timeout)
+
+    # At most one extra round-trip for the confirmation page
+    for _ in range(2):
+        async with session.get(request_url, timeout=client_timeout,
+                               allow_redirects=True) as response:
+            response.raise_for_status()
+
+            prefix = b''
+            content_type = response.headers.get('Content-Type', '')
+            if content_type.startswith('text/html'):
+                # Either the large-file interstitial or an HTML export -
+                # scan a bounded prefix for the confirmation token, as
+                # the sync path does
+                prefix = await response.content.read(_CONFIRM_SCAN_BYTES)
+                text = prefix.decode('utf-8', errors='replace')
+                match = (_CONFIRM_TOKEN_PATTERN.search(text)
+                         or _CONFIRM_FORM_PATTERN.search(text))
+                if match:
+                    request_url = get_confirmation_url(file_id, match.group(1))
+                    continue
+                if format != 'html':
+                    # An interstitial without a parseable token - don't
+                    # save the warning page as the downloaded file
+                    return False
+
+            if aiofiles is not None:
+                async with aiofiles.open(output_path, 'wb') as f:
+                    if prefix:
+                        await f.write(prefix)
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        await f.write(chunk)
+            else:
+                with open(output_path, 'wb') as f:
+                    if prefix:
+                        f.write(prefix)
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        f.write(chunk)
+
+            return True
+
+    return False
+
+
+async def _abatch(urls: List[str], output_dir: str,
+                  format: Optional[str],
+                  limit: int, chunk_size: int, timeout: int) -> int:
+    """Download a batch of URLs concurrently through one session."""
+    logger = setup_logging()
+    connector = aiohttp.TCPConnector(limit=limit, keepalive_timeout=60)
+
+    async with aiohttp.ClientSession(connector=connector,
+                                     headers=DEFAULT_HEADERS) as session:
+        tasks = []
+        for url in urls:
+            file_id = extract_file_id(url)
+            if not file_id:
+                logger.warning(f"Could not extract file ID from: {url}")
+                continue
+            ext = _EXPORT_EXTENSIONS.get(format, '.bin') if format else '.bin'
+            output_path = os.path.join(output_dir, f"{file_id}{ext}")
+            tasks.append(download_file_async(
+                url, output_path, format, session, chunk_size, timeout))
+
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    success_count = 0
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error(f"Download failed: {result}")
+        elif result:
+            success_count += 1
+
+    return success_count
+
+
+def batch_download_async(urls: List[str], output_dir: str,
+                         format: Optional[str] = None,
+                         limit: int = 8, chunk_size: int = 1 << 20,
+                         timeout: int = 30) -> int:
+    """
+    Synchronous entry point for the async batch path.
+
+    Returns:
+        Number of successfully downloaded files
+    """
+    return asyncio.run(
+        _abatch(urls, output_dir, format, limit, chunk_size, timeout))
@@ -8,164 +8,316 @@ import os
 import sys
 import time
 import logging
-from typing import Optional, Tuple
-from urllib.parse import urlparse, parse_qs
+from functools import lru_cache
+from typing import List, Optional, Tuple
+from urllib.parse import urlparse, unquote
+
+# Shared formatter plus the last configured logger - repeated
+# setup_logging calls (one per downloader instance) return immediately
+# instead of re-taking logging's internal lock and rebuilding objects
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+_LOGGER: Optional[logging.Logger] = None
+_LOGGER_LEVEL: Optional[str] = None
+
 
 def setup_logging(level: str = "INFO") -> logging.Logger:
     """Setup logging configuration."""
+    global _LOGGER, _LOGGER_LEVEL
+
+    if _LOGGER is not None and level == _LOGGER_LEVEL:
+        return _LOGGER
+
     logger = logging.getLogger("gdlcli")
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
-    
+
     if not logger.handlers:
         handler = logging.StreamHandler(sys.stdout)
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FORMATTER)
         logger.addHandler(handler)
-    
+
+    _LOGGER = logger
+    _LOGGER_LEVEL = level
     return logger
 
 
+# Every supported Drive/Docs URL shape puts the file ID after one of these
+# markers; a single alternation scans the URL once instead of running
+# several independent patterns over it. The id= arm is anchored to a
+# query boundary so parameters like uuid= don't match.
+_FILE_ID_PATTERN = re.compile(r'(?:/d/|/folders/|(?:^|[?&;])id=)([a-zA-Z0-9-_]+)')
+
+# Characters allowed in a Drive file ID, for the non-regex fast path
+_FILE_ID_CHARS = frozenset(
+    'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_')
+
+def _parse_content_disposition(value: str) -> Optional[str]:
+    """Pull the filename out of a Content-Disposition header value.
+
+    A linear scan - the previous backtracking regex with a quote
+    backreference is the slowest pattern class in re, and the header is
+    short and fixed-shape.
+    """
+    # RFC 5987 extended parameter, e.g. filename*=UTF-8''na%C3%AFve.pdf
+    i = value.find('filename*=')
+    if i != -1:
+        j = i + 10
+        k = value.find(';', j)
+        token = value[j:k if k != -1 else len(value)].strip()
+        sep = token.find("''")
+        if sep != -1:
+            token = token[sep + 2:]
+        return unquote(token) or None
+
+    i = value.find('filename=')
+    if i == -1:
+        return None
+
+    j = i + 9
+    quote = value[j:j + 1]
+    if quote in ('"', "'"):
+        k = value.find(quote, j + 1)
+        return value[j + 1:k] if k > j else None
+
+    k = value.find(';', j)
+    name = value[j:k if k != -1 else len(value)].strip()
+    return name or None
+
+
+def _scan_file_id(url: str, start: int) -> Optional[str]:
+    """Take the run of file-ID characters starting at ``start``."""
+    end = start
+    length = len(url)
+    while end < length and url[end] in _FILE_ID_CHARS:
+        end += 1
+    return url[start:end] if end > start else None
+
+
+@lru_cache(maxsize=4096)
 def extract_file_id(url: str) -> Optional[str]:
     """
     Extract Google Drive file ID from various URL formats.
-    
+
+    Results are cached so repeated lookups for the same URL (CLI
+    validation, batch naming, download) only parse once.
+
     Args:
         url: Google Drive URL
-        
+
     Returns:
         File ID if found, None otherwise
     """
-    # Common Google Drive URL patterns
-    patterns = [
-        r'/file/d/([a-zA-Z0-9-_]+)',  # /file/d/FILE_ID/view
-        r'/open\?id=([a-zA-Z0-9-_]+)',  # /open?id=FILE_ID
-        r'/document/d/([a-zA-Z0-9-_]+)',  # Google Docs
-        r'/spreadsheets/d/([a-zA-Z0-9-_]+)',  # Google Sheets
-        r'/presentation/d/([a-zA-Z0-9-_]+)',  # Google Slides
-        r'id=([a-zA-Z0-9-_]+)',  # Any id= parameter
-    ]
-    
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    
-    return None
+    # IDs are interned: the same file's ID shows up in URL building,
+    # logging and dedupe keys, so equality checks collapse to pointer
+    # compares and only one copy of the string stays alive
+    idx = url.find('/d/')
+    if idx != -1:
+        file_id = _scan_file_id(url, idx + 3)
+        if file_id:
+            return sys.intern(file_id)
+
+    idx = url.find('id=')
+    if idx != -1 and (idx == 0 or url[idx - 1] in '?&;'):
+        file_id = _scan_file_id(url, idx + 3)
+        if file_id:
+            return sys.intern(file_id)
 
+    match = _FILE_ID_PATTERN.search(url)
+    return sys.intern(match.group(1)) if match else None
 
+
+@lru_cache(maxsize=1024)
 def is_google_docs_url(url: str) -> bool:
     """Check if URL is a Google Docs/Sheets/Slides URL."""
-    return any(service in url for service in [
-        'docs.google.com/document',
-        'docs.google.com/spreadsheets', 
-        'docs.google.com/presentation'
-    ])
+    # One scan for the host, then a positional check for the service -
+    # replaces three independent substring searches
+    idx = url.find('docs.google.com/')
+    return idx >= 0 and url.startswith(
+        ('document', 'spreadsheets', 'presentation'), idx + 16)
+
 
+# Fixed URL pieces, assembled once - plain concatenation onto a constant
+# prefix beats re-running the f-string formatter per call
+_DL_PREFIX = 'https://drive.google.com/uc?export=download&id='
+_DOCS_EXPORT_PREFIX = 'https://docs.google.com/uc?export=download&format='
+_CONFIRM_PREFIX = 'https://drive.google.com/uc?export=download&confirm='
 
+
+@lru_cache(maxsize=1024)
 def build_download_url(file_id: str, export_format: Optional[str] = None) -> str:
     """
     Build appropriate download URL for Google Drive file.
-    
+
     Args:
         file_id: Google Drive file ID
         export_format: Export format for Google Docs/Sheets/Slides
-        
+
     Returns:
         Download URL
     """
     if export_format:
         # For Google Docs exports
-        return f"https://docs.google.com/uc?export=download&format={export_format}&id={file_id}"
+        return _DOCS_EXPORT_PREFIX + export_format + '&id=' + file_id
     else:
         # For regular file downloads
-        return f"https://drive.google.com/uc?export=download&id={file_id}"
+        return _DL_PREFIX + file_id
 
 
 def get_confirmation_url(file_id: str, confirm_token: str) -> str:
     """Build confirmation URL for large file downloads."""
-    return f"https://drive.google.com/uc?export=download&confirm={confirm_token}&id={file_id}"
+    return _CONFIRM_PREFIX + confirm_token + '&id=' + file_id
 
 
 def extract_filename_from_response(response) -> Optional[str]:
     """Extract filename from HTTP response headers."""
-    content_disposition = response.headers.get('Content-Disposition', '')
-    
-    if 'filename=' in content_disposition:
-        # Extract filename from Content-Disposition header
-        filename_match = re.search(r'filename[^;=\n]*=(([\'"]).*?\2|[^;\n]*)', content_disposition)
-        if filename_match:
-            filename = filename_match.group(1).strip('\'"')
-            return filename
-    
-    return None
+    # Most responses carry no Content-Disposition at all (or just
+    # `inline`); bail before any parsing work in those cases
+    content_disposition = response.headers.get('Content-Disposition')
+    if not content_disposition or 'filename' not in content_disposition:
+        return None
+
+    return _parse_content_disposition(content_disposition)
+
+
+# Directories already created (or seen) this process - bulk downloads
+# into one directory skip the stat/mkdir syscalls after the first file
+_DIR_CACHE = set()
 
 
 def ensure_directory_exists(file_path: str):
     """Ensure the directory for the given file path exists."""
     directory = os.path.dirname(file_path)
-    if directory and not os.path.exists(directory):
-        os.makedirs(directory, exist_ok=True)
+    if not directory or directory in _DIR_CACHE:
+        return
+    os.makedirs(directory, exist_ok=True)
+    _DIR_CACHE.add(directory)
+
+
+_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
+def _scale(value: float) -> Tuple[float, str]:
+    """Scale a byte count to the largest unit that keeps it below 1024.
+
+    The unit index is an integer log2 (bit_length // 10) rather than a
+    divide-and-compare loop - one bit op instead of up to five float
+    divisions per progress tick.
+    """
+    int_value = int(value)
+    if int_value < 1024:
+        return value, 'B'
+    i = min((int_value.bit_length() - 1) // 10, 5)
+    return value / (1 << (10 * i)), _UNITS[i]
 
 
 def format_bytes(bytes_value: int) -> str:
     """Convert bytes to human readable format."""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024.0:
-            return f"{bytes_value:.1f} {unit}"
-        bytes_value /= 1024.0
-    return f"{bytes_value:.1f} PB"
+    value, unit = _scale(bytes_value)
+    return f"{value:.1f} {unit}"
 
 
 def format_speed(bytes_per_second: float) -> str:
     """Convert bytes per second to human readable format."""
-    return f"{format_bytes(int(bytes_per_second))}/s"
+    value, unit = _scale(bytes_per_second)
+    return f"{value:.1f} {unit}/s"
 
 
 def estimate_eta(downloaded: int, total: int, speed: float) -> str:
     """Estimate time remaining for download."""
     if speed <= 0 or total <= 0:
         return "Unknown"
-    
-    remaining = total - downloaded
-    eta_seconds = remaining / speed
-    
-    if eta_seconds < 60:
-        return f"{int(eta_seconds)}s"
-    elif eta_seconds < 3600:
-        return f"{int(eta_seconds / 60)}m {int(eta_seconds % 60)}s"
-    else:
-        hours = int(eta_seconds / 3600)
-        minutes = int((eta_seconds % 3600) / 60)
-        return f"{hours}h {minutes}m"
+
+    # Truncate once, then divmod gives quotient and remainder together
+    eta = int((total - downloaded) / speed)
+
+    if eta < 60:
+        return f"{eta}s"
+    minutes, seconds = divmod(eta, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes}m"
 
 
+# Prefix fast path for validate_url - covers the overwhelmingly common
+# well-formed http(s) URLs without running the urlparse state machine
+_VALID_URL_PREFIXES = (
+    'https://drive.google.com/',
+    'http://drive.google.com/',
+    'https://docs.google.com/',
+    'http://docs.google.com/',
+)
+
+
+@lru_cache(maxsize=4096)
 def validate_url(url: str) -> bool:
     """Validate if the URL is a proper Google Drive URL."""
-    if not url:
+    # Explicit guards instead of a bare except: urlparse doesn't raise
+    # for str input, and the handler frame cost every call
+    if not isinstance(url, str) or not url:
         return False
-    
-    try:
-        parsed = urlparse(url)
-        return parsed.netloc in ['drive.google.com', 'docs.google.com']
-    except:
+
+    if url.startswith(_VALID_URL_PREFIXES):
+        return True
+
+    # Slow path for unusual shapes (no path, credentials, ports, other
+    # schemes) - only worth parsing if it even looks like a URL
+    if '://' not in url:
         return False
 
+    netloc = urlparse(url).netloc
+    return netloc == 'drive.google.com' or netloc == 'docs.google.com'
+
+
+# One-shot cache for the downloader class so tight download() loops skip
+# the repeated import-machinery and attribute lookups
+_gdlcli_cls = None
+
 
 def download(url: str, output_path: str, **kwargs) -> bool:
     """
     Simple download function for quick usage.
-    
+
     Args:
         url: Google Drive URL
         output_path: Output file path
         **kwargs: Additional options for gdlcli
-        
+
     Returns:
         True if download successful, False otherwise
     """
-    from .downloader import gdlcli
-    
-    downloader = gdlcli(**kwargs)
+    global _gdlcli_cls
+    if _gdlcli_cls is None:
+        from .downloader import gdlcli as _gdlcli_cls
+
+    downloader = _gdlcli_cls(**kwargs)
     return downloader.download_file(url, output_path)
+
+
+def download_many(jobs, max_workers: int = 4, **kwargs) -> List[bool]:
+    """
+    Download multiple (url, output_path) pairs with one shared downloader.
+
+    Unlike calling download() in a loop, the session (and its TLS
+    connections) is set up once and reused, and transfers overlap on a
+    thread pool.
+
+    Args:
+        jobs: Iterable of (url, output_path) pairs
+        max_workers: Number of concurrent downloads
+        **kwargs: Additional options for gdlcli
+
+    Returns:
+        List of per-job success flags, in input order
+    """
+    global _gdlcli_cls
+    if _gdlcli_cls is None:
+        from .downloader import gdlcli as _gdlcli_cls
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    downloader = _gdlcli_cls(max_workers=max_workers, **kwargs)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(
+            lambda job: downloader.download_file(*job), jobs))
@@ -2,24 +2,21 @@
 Test package imports and basic functionality.
 """
 
+# Imported once at module top - each test asserts against the cached
+# module instead of re-probing sys.modules per test
+import gdlcli
+
+
 def test_package_import():
-    """Test that the package can be imported successfully."""
-    try:
-        import gdlcli
-        assert hasattr(gdlcli, 'gdlcli')
-        assert hasattr(gdlcli, 'download')
-        assert hasattr(gdlcli, '__version__')
-        print("✓ Package import successful")
-    except ImportError as e:
-        print(f"✗ Package import failed: {e}")
-        raise
+    """Test that the package exposes its public API."""
+    assert hasattr(gdlcli, 'gdlcli')
+    assert hasattr(gdlcli, 'download')
+    assert hasattr(gdlcli, '__version__')
 
 
 def test_version():
     """Test that version is accessible."""
-    import gdlcli
     assert gdlcli.__version__ == "1.0.0"
-    print(f"✓ Version: {gdlcli.__version__}")
 
 
 if __name__ == "__main__":
@@ -16,7 +16,7 @@ class TestConfig:
         config = Config()
         
         assert config.get('output_dir') == './downloads'
-        assert config.get('chunk_size') == 8192
+        assert config.get('chunk_size') == 1 << 20
         assert config.get('max_retries') == 3
         assert config.get('verify_ssl') is True
     
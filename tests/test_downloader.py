@@ -0,0 +1,48 @@
+"""
+Test downloader batch helpers for gdlcli package.
+"""
+
+import os
+import tempfile
+
+import pytest
+from gdlcli.downloader import gdlcli
+
+
+class TestBatchHelpers:
+    """Test cases for batch download helpers."""
+
+    def test_iter_urls_dedupe_and_comments(self):
+        """Test URL file streaming skips blanks, comments and duplicates."""
+        content = (
+            "https://drive.google.com/file/d/AAA/view\n"
+            "# a comment line\n"
+            "\n"
+            "https://drive.google.com/file/d/BBB/view\n"
+            "https://drive.google.com/file/d/AAA/view\n"
+        )
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+            f.write(content)
+            urls_file = f.name
+
+        try:
+            downloader = gdlcli()
+            urls = list(downloader._iter_urls(urls_file))
+            assert urls == [
+                "https://drive.google.com/file/d/AAA/view",
+                "https://drive.google.com/file/d/BBB/view",
+            ]
+        finally:
+            os.unlink(urls_file)
+
+    def test_generate_output_path_extensions(self):
+        """Test batch filenames derive from the file ID and format."""
+        downloader = gdlcli()
+        url = "https://drive.google.com/file/d/FILE123/view"
+
+        path = downloader._generate_output_path(url, "out")
+        assert path == os.path.join("out", "FILE123.bin")
+
+        path = downloader._generate_output_path(url, "out", format="pdf")
+        assert path == os.path.join("out", "FILE123.pdf")
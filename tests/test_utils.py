@@ -5,8 +5,19 @@ Test utilities for gdlcli package.
 import pytest
 from gdlcli.utils import (
     extract_file_id, validate_url, build_download_url,
-    format_bytes, format_speed, is_google_docs_url
+    format_bytes, format_speed, is_google_docs_url,
+    extract_filename_from_response, download_many
 )
+from gdlcli import utils
+
+
+class FakeResponse:
+    """Minimal stand-in for a requests response with headers."""
+
+    def __init__(self, disposition=None):
+        self.headers = {}
+        if disposition is not None:
+            self.headers['Content-Disposition'] = disposition
 
 
 class TestUtils:
@@ -73,6 +84,60 @@ class TestUtils:
         for bytes_val, expected in test_cases:
             assert format_bytes(bytes_val) == expected
     
+    def test_validate_url_edge_cases(self):
+        """Test validation beyond the common-prefix fast path."""
+        # Host-only URLs skip the prefix fast path but are still valid
+        assert validate_url("https://drive.google.com") is True
+        assert validate_url("http://docs.google.com") is True
+
+        # Google hosts appearing later in the URL must not validate
+        assert validate_url("https://example.com/https://drive.google.com/") is False
+        assert validate_url("https://drive.google.com.evil.com/file") is False
+
+        # Non-string input
+        assert validate_url(None) is False
+        assert validate_url(12345) is False
+
+    def test_extract_filename_from_response(self):
+        """Test filename extraction from Content-Disposition headers."""
+        test_cases = [
+            ('attachment; filename="report.pdf"', "report.pdf"),
+            ("attachment; filename='report.pdf'", "report.pdf"),
+            ("attachment; filename=report.pdf", "report.pdf"),
+            ("attachment; filename=report.pdf; size=123", "report.pdf"),
+            ("attachment; filename*=UTF-8''na%C3%AFve%20data.csv",
+             "naïve data.csv"),
+            ("inline", None),
+        ]
+
+        for disposition, expected in test_cases:
+            assert extract_filename_from_response(
+                FakeResponse(disposition)) == expected
+
+        # No Content-Disposition header at all
+        assert extract_filename_from_response(FakeResponse()) is None
+
+    def test_download_many_results_in_order(self):
+        """Test download_many reports one result per job, in input order."""
+        class FakeDownloader:
+            def __init__(self, **kwargs):
+                pass
+
+            def download_file(self, url, output_path):
+                return 'fail' not in output_path
+
+        original = utils._gdlcli_cls
+        utils._gdlcli_cls = FakeDownloader
+        try:
+            results = download_many(
+                [("u1", "a.bin"), ("u2", "fail.bin"), ("u3", "b.bin")],
+                max_workers=2
+            )
+        finally:
+            utils._gdlcli_cls = original
+
+        assert results == [True, False, True]
+
     def test_is_google_docs_url(self):
         """Test Google Docs URL detection."""
         docs_urls = [